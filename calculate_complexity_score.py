@@ -1,16 +1,67 @@
-import json
 import math
 import os
+from dataclasses import dataclass, asdict
+
+try:
+    import orjson
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    _ORJSON_PRETTY_OPTS = _ORJSON_OPTS | orjson.OPT_INDENT_2
+except ImportError:
+    orjson = None
+    import json
+
+@dataclass(slots=True)
+class AgencyRow:
+    """One output row per agency; slots keep the per-row footprint small."""
+    agency: str
+    agency_id: object
+    total_words: int
+    rule_count: int
+    avg_words_per_rule: float
+    complexity_index: float = 0.0
 
 def load_json(filepath):
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def save_json(data, filepath):
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
+def load_nested_rule_counts(filepath):
+    """
+    Parse a nested rules file and immediately reduce it to an
+    {agency_id: total_rule_count} lookup.
+
+    Only agencyId, ruleCount and the rules array length are read, and the
+    full parsed document is released as soon as the lookup is built instead
+    of being kept alive for the rest of the run.
+    """
+    nested_data = load_json(filepath)
+    # Use "ruleCount" if available; otherwise, count the length of the "rules" array.
+    return {
+        str(agency["agencyId"]): sum(
+            chapter.get("ruleCount", len(chapter.get("rules", ())))
+            for chapter in agency.get("chapters", ())
+        )
+        for agency in nested_data.get("agencies", ())
+        if agency.get("agencyId") is not None
+    }
+
+def save_json(data, filepath, pretty=False):
+    # Compact output by default: the file is machine-consumed and
+    # pretty-printing roughly halves serialization throughput.
+    # Write to a temp file and os.replace it in, so a killed run can never
+    # leave a torn output behind.
+    tmp_path = f"{filepath}.tmp"
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=_ORJSON_PRETTY_OPTS if pretty else _ORJSON_OPTS))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4 if pretty else None)
+    os.replace(tmp_path, filepath)
 
-def main():
+def main(pretty=False):
     # Define input file paths
     grouped_path = "src/data/rules/word_counts/grouped_word_count_2024.json"
     nested_path  = "src/data/rules/nested_2024.json"
@@ -22,7 +73,7 @@ def main():
     
     # Load JSON data from both input files
     grouped_data = load_json(grouped_path)
-    nested_data  = load_json(nested_path)
+    nested_agencies_lookup = load_nested_rule_counts(nested_path)
     
     # Determine the list of agencies from the grouped data.
     if isinstance(grouped_data, list):
@@ -36,21 +87,14 @@ def main():
         print("Unexpected format in grouped data.")
         return
     
-    # Build a lookup from the nested file keyed by agencyId.
-    # For each nested agency, sum the ruleCount from each chapter.
-    nested_agencies_lookup = {}
-    for agency in nested_data.get("agencies", []):
-        agency_id = agency.get("agencyId")
-        if agency_id is not None:
-            total_rule_count = 0
-            for chapter in agency.get("chapters", []):
-                # Use "ruleCount" if available; otherwise, count the length of the "rules" array.
-                total_rule_count += chapter.get("ruleCount", len(chapter.get("rules", [])))
-            nested_agencies_lookup[str(agency_id)] = total_rule_count
+    # Preallocate for one row per agency; rows skipped for a zero rule count
+    # stay None and are filtered out below.
+    results = [None] * len(agencies_list)
+    row_count = 0
+    log_values = []
+    min_log = math.inf
+    max_log = -math.inf
 
-    results = []
-    avg_values = []
-    
     # Process every agency found in the grouped file.
     for agency in agencies_list:
         agency_id = agency.get("agency_id")
@@ -70,49 +114,49 @@ def main():
             continue
 
         avg_words = total_words / rule_count
-        avg_values.append(avg_words)
-        
-        results.append({
-            "agency": agency_name,
-            "agency_id": agency_id,
-            "total_words": total_words,
-            "rule_count": rule_count,
-            "avg_words_per_rule": avg_words
-        })
-    
+        log_current = math.log(avg_words)
+        log_values.append(log_current)
+        if log_current < min_log:
+            min_log = log_current
+        if log_current > max_log:
+            max_log = log_current
+
+        results[row_count] = AgencyRow(
+            agency=agency_name,
+            agency_id=agency_id,
+            total_words=total_words,
+            rule_count=rule_count,
+            avg_words_per_rule=avg_words
+        )
+        row_count += 1
+
+    del results[row_count:]
     if not results:
         print("No agency data found for processing.")
         return
-    
-    # Use linear scaling instead of logarithmic
-    min_avg = min(avg_values)
-    max_avg = max(avg_values)
-    
-    if min_avg == max_avg:
+
+    # Normalize the log-transformed averages to the 20-100 range.
+    if min_log == max_log:
         for item in results:
-            item["complexity_index"] = 60
+            item.complexity_index = 60
     else:
-        # Take log of all values
-        log_values = [math.log(x) for x in avg_values]
-        min_log = min(log_values)
-        max_log = max(log_values)
-        
-        for item in results:
-            current_avg = item["avg_words_per_rule"]
-            # Log transform the current value
-            log_current = math.log(current_avg)
-            # Normalize using log values to 20-100 range
-            normalized = (log_current - min_log) / (max_log - min_log)
-            complexity = 20 + normalized * 80  # 80 = (100 - 20)
-            item["complexity_index"] = round(complexity, 2)
-    
+        scale = 80 / (max_log - min_log)  # 80 = (100 - 20)
+        for item, log_current in zip(results, log_values):
+            item.complexity_index = round(20 + (log_current - min_log) * scale, 2)
+
+    # orjson serializes dataclasses natively; the stdlib fallback needs dicts.
     output_data = {
         "year": "2024",
-        "agencies": results
+        "agencies": results if orjson is not None else [asdict(row) for row in results]
     }
-    
-    save_json(output_data, output_path)
+
+    save_json(output_data, output_path, pretty=pretty)
     print(f"Agency complexity index calculated for {len(results)} agencies and saved to {output_path}.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Calculate agency complexity scores.")
+    parser.add_argument("--pretty", action="store_true",
+                        help="indent the output JSON for human reading")
+    args = parser.parse_args()
+    main(pretty=args.pretty)
\ No newline at end of file
@@ -1,14 +1,27 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from src.api.v1.agencies import router as agencies_router
 from src.api.v1.openlaws import router as openlaws_router
+from src.services.agency_service import AgencyService
 from src.services.cache_service import CacheManager
+from src.services.file_service import FileService
+from src.services.openlaws_service import close_client as close_openlaws_client
+from pathlib import Path
+import asyncio
 import gc
 
+RULES_DATA_DIR = Path(__file__).resolve().parent / "src" / "data" / "rules"
+
+# Re-warm the heavy cached endpoints at half their 1-hour TTL so end users
+# never land on an expiry boundary.
+CACHE_REFRESH_INTERVAL = 1800
+
 app = FastAPI(
     title="Iowa Regulatory Code API",
     description="API for accessing Iowa Regulatory Code data",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -40,8 +53,42 @@ async def startup():
     CacheManager.init_cache("file_cache", max_size=1000)
     CacheManager.init_cache("differences_cache", max_size=500)
 
+    # Warm the FileService cache with every nested_{year}.json so the first
+    # request per year doesn't pay the multi-MB parse.
+    def _preload_nested_files():
+        for year in FileService.get_available_years(str(RULES_DATA_DIR), "nested"):
+            try:
+                FileService.read_json_file(RULES_DATA_DIR / f"nested_{year}.json")
+            except (FileNotFoundError, ValueError):
+                continue
+
+    await asyncio.to_thread(_preload_nested_files)
+
+    # Warm the two heavy endpoints so the first user request hits a warm
+    # cache, then keep them fresh in the background. Supabase may be
+    # unreachable at boot (e.g. local file-only runs); that only skips the
+    # warm-up, it doesn't fail startup.
+    async def _warm_heavy_caches():
+        await asyncio.gather(
+            AgencyService.get_all_agencies(),
+            AgencyService.get_agency_stats(),
+            return_exceptions=True,
+        )
+
+    async def _periodic_refresh():
+        while True:
+            await asyncio.sleep(CACHE_REFRESH_INTERVAL)
+            await _warm_heavy_caches()
+
+    await _warm_heavy_caches()
+    app.state.cache_refresh_task = asyncio.create_task(_periodic_refresh())
+
 @app.on_event("shutdown")
 async def shutdown():
+    refresh_task = getattr(app.state, "cache_refresh_task", None)
+    if refresh_task is not None:
+        refresh_task.cancel()
+    await close_openlaws_client()
     CacheManager.clear_all()
     gc.collect()
 
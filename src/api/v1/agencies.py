@@ -1,34 +1,58 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import List
+import hashlib
+import orjson
 from src.services.agency_service import AgencyService
 from src.services.differences_service import DifferencesService
 
 router = APIRouter()
 
-@router.get("/", response_model=List[dict])
-async def get_agencies():
+# Serialized payloads for cached list endpoints, keyed by route + args and
+# validated by identity against the object the service cache returned: while
+# the service cache holds, the same bytes and ETag are reused verbatim.
+_payload_cache = {}
+
+def _serialize_cached(key, data):
+    cached = _payload_cache.get(key)
+    if cached is not None and cached[0] is data:
+        return cached[1], cached[2]
+    payload = orjson.dumps(data)
+    etag = f'"{hashlib.md5(payload).hexdigest()}"'
+    _payload_cache[key] = (data, payload, etag)
+    return payload, etag
+
+@router.get("/")
+async def get_agencies(request: Request):
     """
     Get all agencies from the database
     """
     try:
         agencies = await AgencyService.get_all_agencies()
-        return agencies
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    # The list only changes between deploys: let proxies/CDNs serve repeats
+    # and revalidating clients skip the body.
+    payload, etag = _serialize_cached(("agencies",), agencies)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
 
-@router.get("/by-year/{year}", response_model=List[dict])
+@router.get("/by-year/{year}")
 async def get_agencies_by_year(year: int):
     """
     Get all agencies that have records for a specific year
-    
+
     Args:
         year (int): The year to filter agencies by
     """
     try:
         agencies = await AgencyService.get_agencies_by_year(year)
-        return agencies
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    payload, _ = _serialize_cached(("agencies_by_year", year), agencies)
+    return Response(content=payload, media_type="application/json")
 
 @router.get("/year/{agency_year_id}/chapters", response_model=List[dict])
 async def get_chapters_by_agency_year(agency_year_id: int):
@@ -185,37 +209,57 @@ async def get_total_rule_volume(start_year: int, end_year: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/stats/agency", response_model=List[dict])
-async def get_agency_stats():
+@router.get("/stats/agency")
+async def get_agency_stats(request: Request):
     """
     Get aggregated statistics for agencies, including word counts and rule counts
     for both the most recent year and historical data since 2012.
-    
+
     Returns:
         List[dict]: A list of agency statistics
     """
     try:
-        stats = await AgencyService.get_agency_stats()
-        return stats
+        # Cached, pre-serialized payload: hits return the raw bytes directly,
+        # and a matching If-None-Match skips the body entirely.
+        payload, etag = await AgencyService.get_agency_stats_bytes()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
 
-@router.get("/agency/{agency_id}/{year}/details", response_model=dict)
+@router.get("/agency/{agency_id}/{year}/details")
 async def get_agency_details_from_local(agency_id: str, year: int):
     """
     Get all chapters and rules for an agency for a given year using local JSON files.
-    
+
     Args:
         agency_id (str): The ID of the agency.
         year (int): The year for which data should be returned.
-        
+
     Returns:
-        dict: A dictionary with the agency details (including its chapters and nested rules)
+        dict: A dictionary with the agency details (including its chapters and nested rules),
+              streamed chapter-by-chapter so the client starts receiving bytes before the
+              whole payload is serialized.
     """
     try:
         result = await AgencyService.get_agency_details_from_local(agency_id, year)
-        if not result:
-            raise HTTPException(status_code=404, detail="Agency not found for the given year.")
-        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if not result:
+        raise HTTPException(status_code=404, detail="Agency not found for the given year.")
+
+    def stream_agency():
+        chapters = result.get("chapters")
+        head = orjson.dumps({k: v for k, v in result.items() if k != "chapters"})
+        if chapters is None:
+            yield head
+            return
+        # Splice the chapters array into the serialized head one chapter at a time.
+        yield head[:-1] + b',"chapters":[' if len(head) > 2 else b'{"chapters":['
+        for index, chapter in enumerate(chapters):
+            yield orjson.dumps(chapter) if index == 0 else b',' + orjson.dumps(chapter)
+        yield b']}'
+
+    return StreamingResponse(stream_agency(), media_type="application/json")
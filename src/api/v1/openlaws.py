@@ -1,5 +1,4 @@
 from fastapi import APIRouter, HTTPException
-from fastapi.concurrency import run_in_threadpool
 from src.services.openlaws_service import get_iowa_rule
 
 router = APIRouter()
@@ -16,8 +15,8 @@ async def get_iowa_rule_endpoint(chapter_rule: str):
         dict: Law division data from the OpenLaws API.
     """
     try:
-        # Since get_iowa_rule() makes a blocking HTTP call, run it in a threadpool.
-        result = await run_in_threadpool(get_iowa_rule, chapter_rule)
+        # get_iowa_rule() is async, so await it directly on the event loop.
+        result = await get_iowa_rule(chapter_rule)
         return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
@@ -1,16 +1,24 @@
+from functools import lru_cache
+from typing import Optional
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
+import httpx
 import os
-from supabase import create_client, Client
+from supabase import create_client, acreate_client, Client, AsyncClient
 
 load_dotenv()
 
+# Connection-pool sizing for the shared PostgREST session. Keep-alive
+# connections let repeat Supabase reads skip the TCP/TLS handshake.
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
 class SupabaseSettings(BaseModel):
-    SUPABASE_URL: str = Field(default=os.getenv("SUPABASE_URL"))
-    SUPABASE_KEY: str = Field(default=os.getenv("SUPABASE_KEY"))
-    SUPABASE_SECRET: str = Field(default=os.getenv("SUPABASE_SECRET"))
+    SUPABASE_URL: str = Field(default_factory=lambda: os.getenv("SUPABASE_URL"))
+    SUPABASE_KEY: str = Field(default_factory=lambda: os.getenv("SUPABASE_KEY"))
+    SUPABASE_SECRET: str = Field(default_factory=lambda: os.getenv("SUPABASE_SECRET"))
 
     @classmethod
+    @lru_cache(maxsize=1)
     def get_settings(cls) -> "SupabaseSettings":
         settings = cls()
         # Validate required settings
@@ -22,14 +30,50 @@ class SupabaseSettings(BaseModel):
         return settings
 
     def get_client(self) -> Client:
-        """Create and return a Supabase client instance."""
-        return create_client(
+        """Create and return a Supabase client instance with a tuned HTTP pool."""
+        client = create_client(
             supabase_url=self.SUPABASE_URL,
             supabase_key=self.SUPABASE_KEY
         )
+        # Swap the default PostgREST session for one with explicit pool
+        # limits so concurrent queries reuse keep-alive connections.
+        default_session = client.postgrest.session
+        client.postgrest.session = httpx.Client(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            timeout=default_session.timeout,
+            limits=_POOL_LIMITS,
+        )
+        return client
+
+@lru_cache(maxsize=1)
+def get_supabase() -> Client:
+    """Return the shared Supabase client, creating it on first use."""
+    return SupabaseSettings.get_settings().get_client()
 
-# Create a singleton instance of settings
-settings = SupabaseSettings.get_settings()
+_async_supabase: Optional[AsyncClient] = None
 
-# Create a singleton instance of the Supabase client
-supabase = settings.get_client()
\ No newline at end of file
+async def get_async_supabase() -> AsyncClient:
+    """
+    Return the shared async Supabase client, creating it on first use.
+
+    Queries issued through this client run natively on the event loop over a
+    persistent pooled httpx.AsyncClient instead of blocking a worker thread.
+    """
+    global _async_supabase
+    if _async_supabase is None:
+        settings = SupabaseSettings.get_settings()
+        client = await acreate_client(
+            supabase_url=settings.SUPABASE_URL,
+            supabase_key=settings.SUPABASE_KEY
+        )
+        # Mirror the sync client's pool tuning on the async PostgREST session.
+        default_session = client.postgrest.session
+        client.postgrest.session = httpx.AsyncClient(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            timeout=default_session.timeout,
+            limits=_POOL_LIMITS,
+        )
+        _async_supabase = client
+    return _async_supabase
@@ -0,0 +1,23 @@
+-- Compound indexes for the hot API query shapes, so the PostgREST-generated
+-- SQL behind AgencyService can use index(-only) scans:
+--   * agencies filtered through agency_years.year (get_agencies_by_year,
+--     get_agency_data_for_year)
+--   * chapters by agency_year_id ordered by chapter_number
+--   * rules by chapter_id ordered by citation
+--   * embedded subrules by rule_id ordered by subrule_number
+--
+-- Run against the Supabase project with psql (CONCURRENTLY cannot run inside
+-- a transaction block). Verify plans with EXPLAIN (ANALYZE, BUFFERS).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS agency_years_year_agency
+    ON agency_years (year, agency_id)
+    INCLUDE (id, total_word_count);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS chapters_agency_year_chapter_number
+    ON chapters (agency_year_id, chapter_number);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS rules_chapter_citation
+    ON rules (chapter_id, citation);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS subrules_rule_subrule_number
+    ON subrules (rule_id, subrule_number);
@@ -0,0 +1,27 @@
+-- Materialized view pre-aggregating the per-agency, per-year stats that the
+-- API otherwise folds together at request time (word counts from
+-- agency_years, rule counts via chapters -> rules). Refresh after each
+-- yearly data load:
+--
+--   REFRESH MATERIALIZED VIEW CONCURRENTLY agency_stats;
+--
+-- Expose it through PostgREST like any table; a SELECT on it replaces the
+-- aggregation entirely.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS agency_stats AS
+SELECT
+    a.id                       AS agency_id,
+    a.agency_name,
+    ay.year,
+    ay.total_word_count,
+    COUNT(r.id)                AS rules_count
+FROM agencies a
+JOIN agency_years ay ON ay.agency_id = a.id
+LEFT JOIN chapters c ON c.agency_year_id = ay.id
+LEFT JOIN rules r ON r.chapter_id = c.id
+GROUP BY a.id, a.agency_name, ay.year, ay.total_word_count;
+
+-- Unique index is required for REFRESH ... CONCURRENTLY and makes the
+-- (agency_id, year) point lookups index-only.
+CREATE UNIQUE INDEX IF NOT EXISTS agency_stats_agency_year
+    ON agency_stats (agency_id, year);
@@ -1,25 +1,30 @@
 from pathlib import Path
-import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+def _load(file_path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
+    with open(file_path, 'r') as f:
+        return json.load(f)
 
 def count_total_chapters():
     """Count total number of chapters across all years 1998-2025"""
     data_dir = Path("src/data/rules")
-    total_chapters = 0
-    
-    for year in range(1998, 2026):
-        file_path = data_dir / f"nested_{year}.json"
-        
-        try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                year_total = sum(agency['chapterCount'] for agency in data['agencies'])
-                total_chapters += year_total
-                
-        except FileNotFoundError:
-            print(f"Warning: Could not find data file for year {year}")
-            continue
-    
+
+    # Single generator-sum over the years; missing files are skipped up front
+    # so no exception handling is needed in the hot loop.
+    total_chapters = sum(
+        sum(agency['chapterCount'] for agency in _load(file_path)['agencies'])
+        for year in range(1998, 2026)
+        if (file_path := data_dir / f"nested_{year}.json").exists()
+    )
+
     print(f"Total chapters across all years (1998-2025): {total_chapters}")
 
 if __name__ == "__main__":
-    count_total_chapters() 
\ No newline at end of file
+    count_total_chapters()
@@ -1,11 +1,65 @@
-import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
+import os
 
-def nest_grouped_word_counts(grouped_folder: str, output_folder: str) -> None:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+def _process_file(file: Path, output_path: Path, pretty: bool = False) -> None:
+    """
+    Nest a single grouped JSON file. Module-level so ProcessPoolExecutor
+    workers can pickle it.
     """
-    Process each JSON file in the grouped folder and nest its content within a 
+    try:
+        # Extract the year from the filename.
+        # Expected filename format: "grouped_word_count_2024.json"
+        stem = file.stem  # e.g., grouped_word_count_2024
+        parts = stem.split("_")
+        year = parts[-1] if parts[-1].isdigit() else "unknown"
+
+        if orjson is not None:
+            agencies = orjson.loads(file.read_bytes())
+        else:
+            with file.open('r') as f:
+                agencies = json.load(f)
+
+        # Sum the total words over all agencies in the file.
+        total_word_count = sum(agency.get("total_words", 0) for agency in agencies)
+
+        # Create the nested structure.
+        nested_data = {
+            "year": year,
+            "total_word_count": total_word_count,
+            "agencies": agencies
+        }
+
+        # Write out the new JSON file (same filename) to the output folder.
+        # Compact by default; these files are machine-consumed. Write to a
+        # temp file and os.replace so readers never see a torn file.
+        output_file = output_path / file.name
+        tmp_file = output_file.with_suffix(output_file.suffix + ".tmp")
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            tmp_file.write_bytes(orjson.dumps(nested_data, option=option))
+        else:
+            with tmp_file.open("w") as f:
+                json.dump(nested_data, f, indent=4 if pretty else None)
+        os.replace(tmp_file, output_file)
+        print(f"Processed file {file.name} for year {year}")
+    except Exception as e:
+        print(f"Error processing {file.name}: {e}")
+
+def nest_grouped_word_counts(grouped_folder: str, output_folder: str, pretty: bool = False) -> None:
+    """
+    Process each JSON file in the grouped folder and nest its content within a
     parent JSON object that includes a "year" field and a "total_word_count" field.
-    
+
     Args:
         grouped_folder (str): Path to the folder containing grouped JSON files.
         output_folder (str): Path to the folder where nested JSON files will be saved.
@@ -14,37 +68,21 @@ def nest_grouped_word_counts(grouped_folder: str, output_folder: str) -> None:
     output_path = Path(output_folder)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Loop through all JSON files in the grouped folder.
-    for file in grouped_path.glob("*.json"):
-        try:
-            # Extract the year from the filename.
-            # Expected filename format: "grouped_word_count_2024.json"
-            stem = file.stem  # e.g., grouped_word_count_2024
-            parts = stem.split("_")
-            year = parts[-1] if parts[-1].isdigit() else "unknown"
-            
-            with file.open('r') as f:
-                agencies = json.load(f)
-            
-            # Sum the total words over all agencies in the file.
-            total_word_count = sum(agency.get("total_words", 0) for agency in agencies)
-
-            # Create the nested structure.
-            nested_data = {
-                "year": year,
-                "total_word_count": total_word_count,
-                "agencies": agencies
-            }
-            
-            # Write out the new JSON file (same filename) to the output folder.
-            output_file = output_path / file.name
-            with output_file.open("w") as f:
-                json.dump(nested_data, f, indent=4)
-            print(f"Processed file {file.name} for year {year}")
-        except Exception as e:
-            print(f"Error processing {file.name}: {e}")
+    files = sorted(grouped_path.glob("*.json"))
+    if not files:
+        return
+
+    # Each yearly file is independent, so fan the work out across cores.
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(partial(_process_file, output_path=output_path, pretty=pretty), files))
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Nest grouped word-count files by year.")
+    parser.add_argument("--pretty", action="store_true",
+                        help="indent the output JSON for human reading")
+    args = parser.parse_args()
+
     input_folder = "src/data/rules/word_counts/grouped"
     output_folder = "src/data/rules/word_counts/nested"
-    nest_grouped_word_counts(input_folder, output_folder)
\ No newline at end of file
+    nest_grouped_word_counts(input_folder, output_folder, pretty=args.pretty)
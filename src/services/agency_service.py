@@ -1,45 +1,66 @@
 from typing import List, Union, Optional, Dict, Any
-from src.database.config import supabase
+from src.database.config import get_async_supabase
+import hashlib
 import os
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from glob import glob
+from operator import itemgetter
 import asyncio
+import re
 from src.services.cache_service import timed_cache
 from src.services.file_service import FileService
-from datetime import datetime
 from pathlib import Path
 
-class AgencyService:
-    _db_cache: Dict[str, Any] = {}
-    _db_cache_timestamps: Dict[str, datetime] = {}
-    _CACHE_DURATION = 3600  # 1 hour in seconds
+# Repo root, resolved once at import so the hot paths skip the realpath
+# syscall per call.
+_BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
-    @staticmethod
-    def _get_cached_db_result(cache_key: str) -> Optional[Any]:
-        current_time = datetime.now()
-        if (cache_key in AgencyService._db_cache and 
-            (current_time - AgencyService._db_cache_timestamps[cache_key]).total_seconds() < AgencyService._CACHE_DURATION):
-            return AgencyService._db_cache[cache_key]
-        return None
+_WORD_COUNT_RE = re.compile(r"grouped_word_count_(\d+)\.json$")
 
-    @staticmethod
-    def _set_db_cache(cache_key: str, data: Any) -> None:
-        AgencyService._db_cache[cache_key] = data
-        AgencyService._db_cache_timestamps[cache_key] = datetime.now()
+# Fetches all flat agency columns in one C-level call per row.
+_agency_cols = itemgetter('id', 'agency_name', 'agency_number', 'created_date', 'last_modified_date')
+
+@lru_cache(maxsize=64)
+def _load_word_count(path_str: str, mtime_ns: int) -> dict:
+    """
+    Parsed grouped_word_count file, memoized on (path, mtime): a stats
+    rebuild only re-parses the files that actually changed on disk.
+    """
+    with open(path_str, "rb") as f:
+        return orjson.loads(f.read())
+
+class AgencyService:
+    # Computed agency stats keyed by the mtime signature of the source files.
+    _stats_cache: Dict[str, Any] = {"sig": None, "value": None}
+    # Per-year {str(agencyId): agency} indexes over nested_{year}.json,
+    # stored with the file mtime they were built from.
+    _nested_index: Dict[int, Any] = {}
+    # Pre-serialized stats payload and its ETag, keyed by identity of the
+    # stats list they were rendered from.
+    _stats_bytes_cache: Dict[str, Any] = {"source": None, "value": None, "etag": None}
+    # In-flight request coalescing: concurrent callers for the same key await
+    # one shared task instead of each recomputing the same cache miss.
+    _inflight: Dict[tuple, asyncio.Task] = {}
+
+    @classmethod
+    async def _coalesce(cls, key: tuple, factory):
+        task = cls._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            cls._inflight[key] = task
+            try:
+                return await task
+            finally:
+                cls._inflight.pop(key, None)
+        return await task
 
     @staticmethod
     @timed_cache(expire=3600, cache_name="db_cache")
     async def get_all_agencies() -> List[dict]:
-        cache_key = "all_agencies"
-        cached_result = AgencyService._get_cached_db_result(cache_key)
-        if cached_result is not None:
-            return cached_result
-
-        # Offload the synchronous supabase call to a thread.
-        response = await asyncio.to_thread(
-            lambda: supabase.table('agencies').select('*').execute()
-        )
-        AgencyService._set_db_cache(cache_key, response.data)
+        supabase = await get_async_supabase()
+        response = await supabase.table('agencies').select('*').execute()
         return response.data
 
     @staticmethod
@@ -54,32 +75,35 @@ class AgencyService:
         Returns:
             List[dict]: A list of agency records that have data for the specified year
         """
-        # Offload synchronous supabase call
-        response = await asyncio.to_thread(
-            lambda: supabase.table('agencies')
-                .select('*, agency_years!inner(id, year, total_word_count)')
-                .eq('agency_years.year', year)
-                .execute()
-        )
-        
-        # Remove duplicate agencies and clean up the response
-        unique_agencies = {}
+        # Select only the columns the response actually uses to keep the
+        # wire payload small.
+        supabase = await get_async_supabase()
+        response = await supabase.table('agencies') \
+            .select('id, agency_name, agency_number, created_date, last_modified_date, '
+                    'agency_years!inner(id, total_word_count)') \
+            .eq('agency_years.year', year) \
+            .execute()
+
+        # The !inner embed with the year filter yields exactly one
+        # agency_years row per agency; _agency_cols pulls the flat columns
+        # in one C-level call per row instead of five dict lookups.
+        agencies = []
         for record in response.data:
-            agency_years = record.pop('agency_years', [])
-            if agency_years:
-                agency_year = agency_years[0]  # Get the first (and should be only) agency_year
-                agency_data = {
-                    'id': record['id'],
-                    'agency_name': record['agency_name'],
-                    'agency_number': record['agency_number'],
-                    'created_date': record['created_date'],
-                    'last_modified_date': record['last_modified_date'],
-                    'agency_year_id': agency_year['id'],
-                    'total_word_count': agency_year['total_word_count']
-                }
-                unique_agencies[record['id']] = agency_data
-        
-        return list(unique_agencies.values())
+            agency_years = record.get('agency_years')
+            if not agency_years:
+                continue
+            agency_id, agency_name, agency_number, created_date, last_modified_date = _agency_cols(record)
+            agency_year = agency_years[0]
+            agencies.append({
+                'id': agency_id,
+                'agency_name': agency_name,
+                'agency_number': agency_number,
+                'created_date': created_date,
+                'last_modified_date': last_modified_date,
+                'agency_year_id': agency_year['id'],
+                'total_word_count': agency_year['total_word_count']
+            })
+        return agencies
 
     @staticmethod
     @timed_cache(expire=3600, cache_name="db_cache")
@@ -93,14 +117,12 @@ class AgencyService:
         Returns:
             List[dict]: A list of chapter records for the specified agency year
         """
-        # Offload the supabase call to a thread.
-        response = await asyncio.to_thread(
-            lambda: supabase.table('chapters')
-                .select('*')
-                .eq('agency_year_id', agency_year_id)
-                .order('chapter_number')
-                .execute()
-        )
+        supabase = await get_async_supabase()
+        response = await supabase.table('chapters') \
+            .select('*') \
+            .eq('agency_year_id', agency_year_id) \
+            .order('chapter_number') \
+            .execute()
         return response.data
 
     @staticmethod
@@ -115,27 +137,19 @@ class AgencyService:
         Returns:
             List[dict]: A list of rule records with nested subrules
         """
-        # Offload the supabase call.
-        response = await asyncio.to_thread(
-            lambda: supabase.table('rules')
-                .select('*, subrules:subrules(*)')
-                .eq('chapter_id', chapter_id)
-                .order('citation')
-                .execute()
-        )
-        
-        # Process the response to ensure subrules are properly nested
-        rules = []
-        for rule in response.data:
-            subrules = rule.pop('subrules', [])
-            subrules.sort(key=lambda x: x['subrule_number'])
-            rule['subrules'] = subrules
-            rules.append(rule)
-        
-        return rules
+        # Sort the embedded subrules server-side so no Python sorting is
+        # needed on the response.
+        supabase = await get_async_supabase()
+        response = await supabase.table('rules') \
+            .select('*, subrules:subrules(*)') \
+            .eq('chapter_id', chapter_id) \
+            .order('citation') \
+            .order('subrule_number', foreign_table='subrules') \
+            .execute()
+
+        return response.data
 
     @classmethod
-    @timed_cache(expire=3600, cache_name="db_cache")
     async def get_agency_stats(cls):
         """
         Aggregates rules and word count statistics for agencies that appear in the most recent year.
@@ -143,34 +157,75 @@ class AgencyService:
           - the totals for the most recent year (from its grouped word count file)
           - the totals for rules and word count, accumulating data from 2012 through the recent year.
         """
+        return await cls._coalesce(("agency_stats",), cls._fetch_agency_stats)
+
+    @classmethod
+    @timed_cache(expire=3600, cache_name="db_cache")
+    async def _fetch_agency_stats(cls):
         return await asyncio.to_thread(cls._get_agency_stats_sync)
 
+    @classmethod
+    async def get_agency_stats_bytes(cls) -> tuple:
+        """
+        Pre-serialized variant of get_agency_stats for the hot endpoint: the
+        orjson buffer and its ETag are cached alongside the stats list, so
+        cache hits skip the recompute, the JSON encode, and the hash.
+
+        Returns:
+            tuple: (payload bytes, quoted ETag string)
+        """
+        stats = await cls.get_agency_stats()
+        if cls._stats_bytes_cache["source"] is stats:
+            return cls._stats_bytes_cache["value"], cls._stats_bytes_cache["etag"]
+        payload = orjson.dumps(stats)
+        etag = f'"{hashlib.md5(payload).hexdigest()}"'
+        cls._stats_bytes_cache = {"source": stats, "value": payload, "etag": etag}
+        return payload, etag
+
     @classmethod
     def _get_agency_stats_sync(cls):
-        BASE_DIR = Path(__file__).resolve().parent.parent.parent
-        base_path = BASE_DIR / "src" / "data" / "rules" / "word_counts"
-        years = FileService.get_available_years(str(base_path), "grouped_word_count")
-        if not years:
+        base_path = _BASE_DIR / "src" / "data" / "rules" / "word_counts"
+        # One directory scan supplies existence and mtimes for every yearly
+        # file, replacing an exists + stat syscall pair per year.
+        available = {}
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                match = _WORD_COUNT_RE.match(entry.name)
+                if match:
+                    available[int(match.group(1))] = (entry.path, entry.stat().st_mtime_ns)
+        if not available:
             raise Exception("No word count files found.")
-        recent_year = max(years)
-        
+        recent_year = max(available)
+        stat_years = sorted(year for year in available if 2012 <= year <= recent_year)
+
+        nested_file = _BASE_DIR / "src" / "data" / "rules" / f"nested_{recent_year}.json"
+
+        # The source files are static between deploys; key the computed stats
+        # on their mtimes so repeat calls return the cached result and only a
+        # changed file forces a recompute.
+        sig_parts = []
+        if os.path.exists(nested_file):
+            sig_parts.append((str(nested_file), os.path.getmtime(nested_file)))
+        sig_parts.extend(available[year] for year in stat_years)
+        sig = tuple(sig_parts)
+        if sig == cls._stats_cache["sig"]:
+            return cls._stats_cache["value"]
+
         # Load nested data
-        nested_file = BASE_DIR / "src" / "data" / "rules" / f"nested_{recent_year}.json"
         nested_data = FileService.read_json_file(nested_file)
-        nested_agencies_lookup = {}
-        if nested_data.get("agencies", []):
-            for agency in nested_data.get("agencies", []):
-                agency_id = agency.get("agencyId")
-                if agency_id is not None:
-                    total_rule_count = 0
-                    for chapter in agency.get("chapters", []):
-                        total_rule_count += chapter.get("ruleCount", len(chapter.get("rules", [])))
-                    nested_agencies_lookup[str(agency_id)] = total_rule_count
+        # Both files carry ids as strings, so key on the raw value and skip
+        # the per-agency str() round-trips in the hot loops below.
+        nested_agencies_lookup = {
+            agency["agencyId"]: sum(
+                chapter.get("ruleCount") or len(chapter.get("rules") or ())
+                for chapter in agency.get("chapters") or ()
+            )
+            for agency in nested_data.get("agencies") or ()
+            if agency.get("agencyId") is not None
+        }
         
         # Load data for the most recent year
-        recent_file = base_path / f"grouped_word_count_{recent_year}.json"
-        with open(recent_file, "r") as f:
-            recent_data = json.load(f)
+        recent_data = _load_word_count(*available[recent_year])
         recent_agencies = recent_data.get("agencies", [])
         
         stats = {}
@@ -180,7 +235,7 @@ class AgencyService:
             recent_total_word_count = agency.get("total_words", 0)
             
             # Get rule count from nested data if available, otherwise fall back to chapter count
-            recent_rules_count = nested_agencies_lookup.get(str(agency_id))
+            recent_rules_count = nested_agencies_lookup.get(agency_id)
             if recent_rules_count is None:
                 recent_rules_count = len(agency.get("chapters", []))
             
@@ -196,29 +251,38 @@ class AgencyService:
             }
         
         # For each year from 2012 up to the most recent year, populate the agency's yearly stats.
-        for year in range(2012, recent_year + 1):
-            file_path = base_path / f"grouped_word_count_{year}.json"
-            if os.path.exists(file_path):
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-                for agency in data.get("agencies", []):
-                    agency_id = agency.get("agency_id")
-                    # Only add if the agency appears in the recent year.
-                    if agency_id in stats:
-                        stats[agency_id]["yearly_stats"].append({
-                            "year": year,
-                            "total_word_count": agency.get("total_words", 0),
-                            "rules_count": len(agency.get("chapters", []))
-                        })
-        
-        return list(stats.values())
+        # The yearly files are independent, so read and parse them in parallel
+        # and keep only the folding single-threaded.
+        def _load_year(year):
+            return year, _load_word_count(*available[year])
 
-    @staticmethod
-    @timed_cache(expire=3600, cache_name="db_cache")
-    async def get_agency_data_for_year(agency_id: int, year: int) -> dict:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            yearly_data = list(executor.map(_load_year, stat_years))
+
+        # Hoist the attribute lookups out of the fold: this loop runs once per
+        # agency per year, so the repeated stats.get/dict.append resolution adds up.
+        stats_get = stats.get
+        for year, data in yearly_data:
+            for agency in data.get("agencies", []):
+                agency_get = agency.get
+                # Only add if the agency appears in the recent year.
+                entry = stats_get(agency_get("agency_id"))
+                if entry is not None:
+                    entry["yearly_stats"].append({
+                        "year": year,
+                        "total_word_count": agency_get("total_words", 0),
+                        "rules_count": len(agency_get("chapters", []))
+                    })
+
+        result = list(stats.values())
+        cls._stats_cache = {"sig": sig, "value": result}
+        return result
+
+    @classmethod
+    async def get_agency_data_for_year(cls, agency_id: int, year: int) -> dict:
         """
         Retrieve all chapters and associated rules for a specific agency in a given year.
-        
+
         Args:
             agency_id (int): The ID of the agency.
             year (int): The year to retrieve data for.
@@ -244,12 +308,23 @@ class AgencyService:
                       ]
                   }
         """
-        # Query the agency record with nested agency_years for the specified year.
-        response = supabase.table("agencies") \
-                    .select("*, agency_years!inner(id, year)") \
-                    .eq("id", agency_id) \
-                    .eq("agency_years.year", year) \
-                    .execute()
+        return await cls._coalesce(
+            ("agency_data", agency_id, year),
+            lambda: cls._fetch_agency_data_for_year(agency_id, year),
+        )
+
+    @staticmethod
+    @timed_cache(expire=3600, cache_name="db_cache")
+    async def _fetch_agency_data_for_year(agency_id: int, year: int) -> dict:
+        # Fetch the whole agency -> chapters -> rules -> subrules tree in one
+        # nested select; PostgREST joins server-side so this is a single
+        # round trip instead of agency + chapters + rules queries.
+        supabase = await get_async_supabase()
+        response = await supabase.table("agencies") \
+            .select("*, agency_years!inner(id, year, chapters(*, rules(*, subrules:subrules(*))))") \
+            .eq("id", agency_id) \
+            .eq("agency_years.year", year) \
+            .execute()
         agencies = response.data
         if not agencies:
             return None
@@ -259,16 +334,15 @@ class AgencyService:
         if not agency_years:
             return None
 
-        agency_year_id = agency_years[0].get("id")
-        # Retrieve chapters for the agency year.
-        chapters = await AgencyService.get_chapters_by_agency_year(agency_year_id)
-
-        # For each chapter, retrieve its rules concurrently.
-        rules_tasks = [AgencyService.get_rules_with_subrules_by_chapter(chapter["id"]) for chapter in chapters]
-        chapters_rules = await asyncio.gather(*rules_tasks)
-
-        # Attach the rules to their corresponding chapter.
-        for chapter, rules in zip(chapters, chapters_rules):
+        # Walk the returned tree once, sorting each level the way the
+        # per-table queries used to.
+        chapters = agency_years[0].get("chapters", [])
+        chapters.sort(key=itemgetter("chapter_number"))
+        for chapter in chapters:
+            rules = chapter.get("rules", [])
+            rules.sort(key=itemgetter("citation"))
+            for rule in rules:
+                rule.get("subrules", []).sort(key=itemgetter("subrule_number"))
             chapter["rules"] = rules
 
         # Get complexity score before return
@@ -286,73 +360,118 @@ class AgencyService:
             "chapters": chapters
         }
 
-    @staticmethod
-    async def get_agency_details_from_local(agency_id: Union[str, int], year: int) -> Optional[dict]:
+    @classmethod
+    async def get_agency_details_from_local(cls, agency_id: Union[str, int], year: int) -> Optional[dict]:
         """
         Retrieve all chapters and rules for an agency for a given year using local JSON files.
-        
+
         Args:
             agency_id (str or int): The ID of the agency.
             year (int): The year for which to retrieve the data.
-            
+
         Returns:
             dict: A dictionary containing the agency details (including chapters with their nested rules)
                   or None if the agency or file is not found.
         """
+        return await cls._coalesce(
+            ("agency_details_local", str(agency_id), year),
+            lambda: cls._fetch_agency_details_from_local(agency_id, year),
+        )
+
+    @staticmethod
+    async def _fetch_agency_details_from_local(agency_id: Union[str, int], year: int) -> Optional[dict]:
         def _sync():
-            BASE_DIR = Path(__file__).resolve().parent.parent.parent
-            file_path = BASE_DIR / "src" / "data" / "rules" / f"nested_{year}.json"
+            file_path = _BASE_DIR / "src" / "data" / "rules" / f"nested_{year}.json"
             if not os.path.exists(file_path):
                 return None
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            agencies = data.get("agencies", [])
-            for agency in agencies:
+
+            # Look the agency up in a per-year index instead of scanning every
+            # agency in the file per request; the index is rebuilt only when
+            # the file's mtime changes.
+            mtime = os.path.getmtime(file_path)
+            cached = AgencyService._nested_index.get(year)
+            if cached is None or cached[0] != mtime:
+                # Reuse the FileService cache so repeat requests against the
+                # same year skip the multi-MB re-parse entirely.
+                data = FileService.read_json_file(file_path)
                 # Use "agencyId" to match the JSON file structure
-                if str(agency.get("agencyId")) == str(agency_id):
-                    # Add complexity score before returning
-                    complexity_score = AgencyService._get_complexity_score(
-                        agency_id, 
-                        agency.get("agencyName")
-                    )
-                    agency["complexity_score"] = complexity_score
-                    return agency
-            return None
+                index = {str(agency.get("agencyId")): agency
+                         for agency in data.get("agencies", [])}
+                AgencyService._nested_index[year] = (mtime, index)
+            else:
+                index = cached[1]
+
+            agency = index.get(str(agency_id))
+            if agency is None:
+                return None
+
+            # Add complexity score before returning
+            agency["complexity_score"] = AgencyService._get_complexity_score(
+                agency_id,
+                agency.get("agencyName")
+            )
+            return agency
 
         return await asyncio.to_thread(_sync)
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_complexity_index() -> Dict[str, Any]:
+        """
+        Load the complexity data file once and index it for O(1) lookups.
+
+        The file is immutable at runtime, so it is parsed a single time and
+        reduced to a {str(agency_id): complexity_index} map, plus the score
+        for the Engineering and Land Surveying Examining Board, which is
+        matched by name as a fallback.
+        """
+        try:
+            file_path = _BASE_DIR / "src" / "data" / "complexity" / "agency_complexity_2024.json"
+            if not os.path.exists(file_path):
+                return {"by_id": {}, "engineering_score": None}
+
+            with open(file_path, "rb") as f:
+                data = orjson.loads(f.read())
+
+            agencies = data.get("agencies", [])
+            return {
+                "by_id": {str(agency.get("agency_id")): agency.get("complexity_index")
+                          for agency in agencies},
+                "engineering_score": next(
+                    (agency.get("complexity_index") for agency in agencies
+                     if "Engineering and Land Surveying Examining Board" in agency.get("agency", "")),
+                    None
+                )
+            }
+        except Exception:
+            return {"by_id": {}, "engineering_score": None}
+
+    @classmethod
+    def refresh_complexity(cls) -> None:
+        """Drop the cached complexity index so the next lookup re-reads the file."""
+        cls._load_complexity_index.cache_clear()
+
     @staticmethod
     def _get_complexity_score(agency_id: Union[str, int], agency_name: str = None) -> Optional[float]:
         """
-        Get the complexity score for an agency from the complexity data file.
-        
+        Get the complexity score for an agency from the cached complexity index.
+
         Args:
             agency_id (Union[str, int]): The ID of the agency
             agency_name (str, optional): The name of the agency, used as fallback for specific cases
-            
+
         Returns:
             Optional[float]: The complexity score if found, None otherwise
         """
-        try:
-            BASE_DIR = Path(__file__).resolve().parent.parent.parent
-            file_path = BASE_DIR / "src" / "data" / "complexity" / "agency_complexity_2024.json"
-            if not os.path.exists(file_path):
-                return None
-            
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            
-            # First try to match by ID
-            for agency in data.get("agencies", []):
-                if str(agency.get("agency_id")) == str(agency_id):
-                    return agency.get("complexity_index")
-            
-            # If ID match fails and we have a name, try name matching for specific cases
-            if agency_name and "Engineering and Land Surveying Examining Board" in agency_name:
-                for agency in data.get("agencies", []):
-                    if "Engineering and Land Surveying Examining Board" in agency.get("agency", ""):
-                        return agency.get("complexity_index")
-                    
-            return None
-        except Exception:
-            return None
+        index = AgencyService._load_complexity_index()
+
+        # First try to match by ID
+        score = index["by_id"].get(str(agency_id))
+        if score is not None:
+            return score
+
+        # If ID match fails and we have a name, try name matching for specific cases
+        if agency_name and "Engineering and Land Surveying Examining Board" in agency_name:
+            return index["engineering_score"]
+
+        return None
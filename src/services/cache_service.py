@@ -1,28 +1,35 @@
+from collections import OrderedDict
 from functools import wraps
 from typing import Any, Callable, Dict
 import asyncio
-from datetime import datetime
+import time
 import gc
 
 class CacheManager:
-    _caches: Dict[str, Dict[str, Any]] = {}
-    _timestamps: Dict[str, Dict[str, datetime]] = {}
+    _caches: Dict[str, "OrderedDict[Any, Any]"] = {}
+    _timestamps: Dict[str, Dict[Any, float]] = {}
     _max_sizes: Dict[str, int] = {}
+    # Per-cache in-flight computations, so concurrent misses for the same
+    # key share one rebuild instead of each running the wrapped function
+    _inflight: Dict[str, Dict[Any, asyncio.Future]] = {}
 
     @classmethod
     def init_cache(cls, cache_name: str, max_size: int = 1000):
         """Initialize a new cache with given name and max size"""
-        cls._caches[cache_name] = {}
+        cls._caches[cache_name] = OrderedDict()
         cls._timestamps[cache_name] = {}
         cls._max_sizes[cache_name] = max_size
+        cls._inflight[cache_name] = {}
 
     @classmethod
-    def clear_all(cls):
-        """Clear all caches"""
+    def clear_all(cls, collect: bool = False):
+        """Clear all caches, optionally forcing a garbage collection pass"""
         cls._caches.clear()
         cls._timestamps.clear()
         cls._max_sizes.clear()
-        gc.collect()
+        cls._inflight.clear()
+        if collect:
+            gc.collect()
 
 def timed_cache(expire: int = 3600, cache_name: str = "default", max_size: int = 1000):
     """
@@ -43,37 +50,51 @@ def timed_cache(expire: int = 3600, cache_name: str = "default", max_size: int =
             cache = CacheManager._caches[cache_name]
             timestamps = CacheManager._timestamps[cache_name]
             
-            # Create cache key
-            cache_key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-            current_time = datetime.now()
-            
-            # Clean old entries if cache is too large
-            if len(cache) > CacheManager._max_sizes[cache_name]:
-                old_keys = [k for k, t in timestamps.items() 
-                          if (current_time - t).total_seconds() > expire]
-                for k in old_keys:
-                    cache.pop(k, None)
-                    timestamps.pop(k, None)
-                gc.collect()
-            
-            # Check cache
+            # Create cache key; tuples hash in C, so this avoids the str()
+            # round-trips of a formatted key on every call.
+            cache_key = (func.__qualname__, args, tuple(sorted(kwargs.items())) if kwargs else ())
+            # Monotonic floats are cheaper than datetime objects and immune
+            # to wall-clock jumps shifting TTLs.
+            current_time = time.monotonic()
+
+            # Check cache; a hit is refreshed in the LRU order
             if cache_key in cache:
-                if (current_time - timestamps[cache_key]).total_seconds() < expire:
+                if current_time - timestamps[cache_key] < expire:
+                    cache.move_to_end(cache_key)
                     return cache[cache_key]
                 else:
                     cache.pop(cache_key, None)
                     timestamps.pop(cache_key, None)
-            
+
+            # Coalesce concurrent misses: followers await the leader's future
+            inflight = CacheManager._inflight[cache_name]
+            future = inflight.get(cache_key)
+            if future is not None:
+                return await future
+            future = asyncio.get_running_loop().create_future()
+            inflight[cache_key] = future
+
             # Get fresh result
-            if asyncio.iscoroutinefunction(func):
-                result = await func(*args, **kwargs)
-            else:
-                result = await asyncio.to_thread(func, *args, **kwargs)
-            
-            # Cache result
+            try:
+                if asyncio.iscoroutinefunction(func):
+                    result = await func(*args, **kwargs)
+                else:
+                    result = await asyncio.to_thread(func, *args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+                future.exception()  # mark retrieved if nobody is waiting
+                raise
+            finally:
+                inflight.pop(cache_key, None)
+            future.set_result(result)
+
+            # Cache result and evict the least recently used entries if full
             cache[cache_key] = result
             timestamps[cache_key] = current_time
-            
+            while len(cache) > CacheManager._max_sizes[cache_name]:
+                old_key, _ = cache.popitem(last=False)
+                timestamps.pop(old_key, None)
+
             return result
             
         return async_wrapper
@@ -1,22 +1,141 @@
-import json
+import asyncio
+import logging
+import orjson
 import os
+from collections import namedtuple
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from src.services.cache_service import timed_cache
+from src.services.file_service import FileService
 from functools import lru_cache
-from datetime import datetime
+import time
+
+logger = logging.getLogger(__name__)
+
+_RULES_DIR = Path(__file__).resolve().parent.parent.parent / "src" / "data" / "rules"
+_LAWS_DIR = _RULES_DIR.parent / "laws"
+
+YearSummary = namedtuple('YearSummary', 'total_rules total_listed_rules total_word_count')
+
+@lru_cache(maxsize=64)
+def _load_json_file(path_str: str, mtime_ns: int) -> dict:
+    """
+    Parsed JSON document memoized on (path, mtime): each year file is
+    parsed once per process and reused as "current" and "previous" across
+    iterations and endpoints, until the file itself changes.
+    """
+    with open(path_str, "rb") as f:
+        return orjson.loads(f.read())
+
+@lru_cache(maxsize=64)
+def _year_agency_counts(path_str: str, mtime_ns: int) -> Dict:
+    """
+    Compact per-year aggregate derived from a nested year file:
+    {agency_id: (agency_name, chapter_count, rule_count)}. Built once per
+    file version, so the diff endpoints work on ~100 small tuples instead
+    of re-walking the full nested tree per call.
+    """
+    data = _load_json_file(path_str, mtime_ns)
+    # The nested schema guarantees these keys on every node, so direct
+    # subscripting replaces a .get method lookup + call per element.
+    return {
+        agency['agencyId']: (
+            agency['agencyName'],
+            agency['chapterCount'],
+            sum(chapter['ruleCount'] for chapter in agency['chapters']),
+        )
+        for agency in data['agencies']
+    }
+
+def _agency_counts_for(file_path) -> Dict:
+    return _year_agency_counts(str(file_path), os.stat(file_path).st_mtime_ns)
+
+@lru_cache(maxsize=64)
+def _year_rule_numbers(path_str: str, mtime_ns: int) -> frozenset:
+    """
+    Every rule number appearing in one year file, frozen for reuse: the
+    new-rules count is then a single set difference between two cached sets.
+    """
+    data = _load_json_file(path_str, mtime_ns)
+    return frozenset(
+        rule['ruleNumber']
+        for agency in data['agencies']
+        for chapter in agency['chapters']
+        for rule in chapter['rules']
+    )
+
+def _rule_numbers_for(file_path) -> frozenset:
+    return _year_rule_numbers(str(file_path), os.stat(file_path).st_mtime_ns)
+
+@lru_cache(maxsize=64)
+def _year_rule_totals(path_str: str, mtime_ns: int) -> Tuple[int, int]:
+    """(sum of ruleCount, sum of len(rules)) over one year file, in one walk."""
+    data = _load_json_file(path_str, mtime_ns)
+    counted = 0
+    listed = 0
+    for agency in data['agencies']:
+        for chapter in agency['chapters']:
+            counted += chapter['ruleCount']
+            listed += len(chapter['rules'])
+    return counted, listed
+
+@lru_cache(maxsize=64)
+def _year_word_total(path_str: str, mtime_ns: int) -> int:
+    return _load_json_file(path_str, mtime_ns).get('total_word_count', 0)
+
+@lru_cache(maxsize=1)
+def _law_counts_table() -> Dict[int, int]:
+    """
+    {year: totalBills} built from one scan of the laws directory. Each
+    signed_bills file is parsed just to pull a single integer, so loading
+    them all once turns every later law-count lookup into a dict access
+    with zero I/O. Uses an absolute path so the table doesn't depend on
+    the process working directory.
+    """
+    prefix = "signed_bills_"
+    plen = len(prefix)
+    counts = {}
+    with os.scandir(_LAWS_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(".json"):
+                try:
+                    year = int(name[plen:-5])
+                except ValueError:
+                    continue
+                with open(entry.path, 'rb') as f:
+                    counts[year] = orjson.loads(f.read()).get('totalBills', 0)
+    return counts
+
+def _year_summary(year: int) -> YearSummary:
+    """
+    Per-year totals composed from the mtime-keyed memos, so warm calls touch
+    no JSON at all. Raises FileNotFoundError if the nested file is missing;
+    a missing word-count file contributes 0 (checked against the available
+    years set rather than by catching the open failure).
+    """
+    nested_file = _RULES_DIR / f"nested_{year}.json"
+    counted, listed = _year_rule_totals(str(nested_file), os.stat(nested_file).st_mtime_ns)
+    word_counts_dir = _RULES_DIR / "word_counts"
+    if year in FileService.get_available_years_set(str(word_counts_dir), "grouped_word_count"):
+        word_count_file = word_counts_dir / f"grouped_word_count_{year}.json"
+        total_words = _year_word_total(str(word_count_file), os.stat(word_count_file).st_mtime_ns)
+    else:
+        total_words = 0
+    return YearSummary(counted, listed, total_words)
 
 class DifferencesService:
     _differences_cache: Dict[Tuple[int, int], List[dict]] = {}
-    _differences_timestamps: Dict[Tuple[int, int], datetime] = {}
+    _differences_timestamps: Dict[Tuple[int, int], float] = {}
     _CACHE_DURATION = 3600
 
     @staticmethod
     def _get_cached_differences(start_year: int, end_year: int) -> Optional[List[dict]]:
         key = (start_year, end_year)
-        current_time = datetime.now()
-        if (key in DifferencesService._differences_cache and 
-            (current_time - DifferencesService._differences_timestamps[key]).total_seconds() < DifferencesService._CACHE_DURATION):
+        # Monotonic floats: one subtraction per check, no datetime allocation,
+        # and TTLs unaffected by wall-clock adjustments.
+        if (key in DifferencesService._differences_cache and
+            time.monotonic() - DifferencesService._differences_timestamps[key] < DifferencesService._CACHE_DURATION):
             return DifferencesService._differences_cache[key]
         return None
 
@@ -24,7 +143,7 @@ class DifferencesService:
     def _set_differences_cache(start_year: int, end_year: int, data: List[dict]) -> None:
         key = (start_year, end_year)
         DifferencesService._differences_cache[key] = data
-        DifferencesService._differences_timestamps[key] = datetime.now()
+        DifferencesService._differences_timestamps[key] = time.monotonic()
 
     @staticmethod
     @timed_cache(expire=3600, cache_name="differences_cache")
@@ -46,111 +165,110 @@ class DifferencesService:
             return cached_result
 
         differences = []
-        
+
+        # Load every year in the range once up front (concurrently); the
+        # pairwise loop below would otherwise re-read and re-parse each file
+        # twice.
+        data_by_year = await DifferencesService._load_years_async(data_dir, start_year, end_year)
+
         for year in range(start_year + 1, end_year + 1):
             current_year = year
             previous_year = year - 1
-            
-            # Load data from JSON files
-            current_file = data_dir / f"nested_{current_year}.json"
-            previous_file = data_dir / f"nested_{previous_year}.json"
-            
-            try:
-                with open(current_file, 'r') as f:
-                    current_data = json.load(f)
-                with open(previous_file, 'r') as f:
-                    previous_data = json.load(f)
-                    
-                # Calculate agency-level differences
-                agency_differences = DifferencesService._calculate_agency_differences(
-                    json.dumps(previous_data['agencies']),
-                    json.dumps(current_data['agencies'])
-                )
-                
-                # Calculate total differences across all agencies
-                total_chapters_diff = sum(diff['chapter_difference'] for diff in agency_differences)
-                total_rules_diff = sum(diff['rule_difference'] for diff in agency_differences)
-                
-                year_diff = {
-                    'year': current_year,
-                    'previous_year': previous_year,
-                    'total_differences': {
-                        'chapters': total_chapters_diff,
-                        'rules': total_rules_diff
-                    },
-                    'agency_differences': agency_differences
-                }
-                
-                differences.append(year_diff)
-                
-            except FileNotFoundError as e:
-                print(f"Warning: Could not find data file for year {year} or {previous_year}")
+
+            if current_year not in data_by_year or previous_year not in data_by_year:
+                logger.warning("Could not find data file for year %s or %s", year, previous_year)
                 continue
-                
+
+            # Calculate agency-level differences from the cached count tables
+            agency_differences = DifferencesService._calculate_agency_differences(
+                _agency_counts_for(data_dir / f"nested_{previous_year}.json"),
+                _agency_counts_for(data_dir / f"nested_{current_year}.json")
+            )
+
+            # Calculate total differences across all agencies
+            total_chapters_diff = sum(diff['chapter_difference'] for diff in agency_differences)
+            total_rules_diff = sum(diff['rule_difference'] for diff in agency_differences)
+
+            year_diff = {
+                'year': current_year,
+                'previous_year': previous_year,
+                'total_differences': {
+                    'chapters': total_chapters_diff,
+                    'rules': total_rules_diff
+                },
+                'agency_differences': agency_differences
+            }
+
+            differences.append(year_diff)
+
         DifferencesService._set_differences_cache(start_year, end_year, differences)
         return differences
 
     @staticmethod
-    @lru_cache(maxsize=128)
-    def _calculate_agency_differences(prev_agencies_str: str, curr_agencies_str: str) -> List[dict]:
+    def _read_json(file_path) -> dict:
+        """Read and parse a single JSON data file through the mtime-keyed memo."""
+        return _load_json_file(str(file_path), os.stat(file_path).st_mtime_ns)
+
+    @staticmethod
+    async def _load_years_async(data_dir: Path, start_year: int, end_year: int) -> Dict[int, dict]:
         """
-        Memoized version of difference calculation
+        Load nested_{year}.json for every year in [start_year, end_year],
+        reading the files concurrently via asyncio.to_thread + gather so the
+        event loop isn't blocked and the independent loads overlap. Missing
+        years are filtered out up front with a set membership test (no
+        open-and-catch per absent year) and are simply absent from the
+        returned dict.
+        """
+        available = FileService.get_available_years_set(str(data_dir), "nested")
+        years = [year for year in range(start_year, end_year + 1) if year in available]
+        loaded = await asyncio.gather(
+            *(asyncio.to_thread(DifferencesService._read_json, data_dir / f"nested_{year}.json")
+              for year in years)
+        )
+        return dict(zip(years, loaded))
+
+    @staticmethod
+    def _calculate_agency_differences(previous_counts: Dict, current_counts: Dict) -> List[dict]:
+        """
+        Compute per-agency chapter and rule differences from two per-year
+        count tables. The tables themselves are memoized per file version,
+        which replaces the old lru_cache keyed on a serialized copy of the
+        entire agencies list.
         """
-        prev_agencies = json.loads(prev_agencies_str)
-        curr_agencies = json.loads(curr_agencies_str)
         differences = []
-        
-        # Create lookup dictionaries
-        prev_lookup = {agency['agencyId']: agency for agency in prev_agencies}
-        curr_lookup = {agency['agencyId']: agency for agency in curr_agencies}
-        
-        # Get all unique agency IDs
-        all_agency_ids = set(prev_lookup.keys()) | set(curr_lookup.keys())
-        
-        for agency_id in all_agency_ids:
-            prev_agency = prev_lookup.get(agency_id, {'chapterCount': 0, 'chapters': []})
-            curr_agency = curr_lookup.get(agency_id, {'chapterCount': 0, 'chapters': []})
-            
-            # Calculate rule counts
-            prev_rule_count = sum(chapter.get('ruleCount', 0) for chapter in prev_agency.get('chapters', []))
-            curr_rule_count = sum(chapter.get('ruleCount', 0) for chapter in curr_agency.get('chapters', []))
-            
+        absent = ('Unknown', 0, 0)
+
+        for agency_id in previous_counts.keys() | current_counts.keys():
+            prev_name, prev_chapters, prev_rules = previous_counts.get(agency_id, absent)
+            curr_name, curr_chapters, curr_rules = current_counts.get(agency_id, absent)
+
             # Calculate differences (newer minus older)
-            chapter_diff = curr_agency['chapterCount'] - prev_agency['chapterCount']
-            rule_diff = curr_rule_count - prev_rule_count
-            
+            chapter_diff = curr_chapters - prev_chapters
+            rule_diff = curr_rules - prev_rules
+
             # Only include agencies that had changes
             if chapter_diff != 0 or rule_diff != 0:
-                diff = {
+                differences.append({
                     'agency_id': agency_id,
-                    'agency_name': curr_agency.get('agencyName', prev_agency.get('agencyName', 'Unknown')),
+                    'agency_name': curr_name if agency_id in current_counts else prev_name,
                     'chapter_difference': chapter_diff,
                     'rule_difference': rule_diff
-                }
-                differences.append(diff)
-            
+                })
+
         return differences
 
     @staticmethod
-    def _calculate_total_chapters_difference(previous_agencies: List[dict], current_agencies: List[dict]) -> int:
-        """Calculate total chapter count difference"""
-        prev_total = sum(agency['chapterCount'] for agency in previous_agencies)
-        curr_total = sum(agency['chapterCount'] for agency in current_agencies)
+    def _calculate_total_chapters_difference(previous_counts: Dict, current_counts: Dict) -> int:
+        """Calculate total chapter count difference from per-year count tables"""
+        prev_total = sum(counts[1] for counts in previous_counts.values())
+        curr_total = sum(counts[1] for counts in current_counts.values())
         return curr_total - prev_total
 
     @staticmethod
-    def _calculate_total_rules_difference(previous_agencies: List[dict], current_agencies: List[dict]) -> int:
-        """Calculate total rule count difference"""
-        prev_total = sum(
-            chapter.get('ruleCount', 0)
-            for agency in previous_agencies
-            for chapter in agency.get('chapters', [])
-        )
-        curr_total = sum(
-            chapter.get('ruleCount', 0)
-            for agency in current_agencies
-            for chapter in agency.get('chapters', [])
-        )
+    def _calculate_total_rules_difference(previous_counts: Dict, current_counts: Dict) -> int:
+        """Calculate total rule count difference from per-year count tables"""
+        prev_total = sum(counts[2] for counts in previous_counts.values())
+        curr_total = sum(counts[2] for counts in current_counts.values())
         return curr_total - prev_total
 
     @staticmethod
@@ -174,51 +292,82 @@ class DifferencesService:
             return cached_result
 
         differences = []
-        
+
+        # Load every year in the range once up front (concurrently) instead of
+        # twice per pair.
+        data_by_year = await DifferencesService._load_years_async(data_dir, start_year, end_year)
+
         for year in range(start_year + 1, end_year + 1):
             current_year = year
             previous_year = year - 1
-            
-            # Load data from JSON files
-            current_file = data_dir / f"nested_{current_year}.json"
-            previous_file = data_dir / f"nested_{previous_year}.json"
-            
-            try:
-                with open(current_file, 'r') as f:
-                    current_data = json.load(f)
-                with open(previous_file, 'r') as f:
-                    previous_data = json.load(f)
-                    
-                # Use the same calculation methods as the detailed endpoint
-                total_chapters_diff = DifferencesService._calculate_total_chapters_difference(
-                    previous_data['agencies'],
-                    current_data['agencies']
-                )
-                total_rules_diff = DifferencesService._calculate_total_rules_difference(
-                    previous_data['agencies'],
-                    current_data['agencies']
-                )
-                
-                # Get total laws for current year
-                total_laws = DifferencesService._get_law_count_for_year(current_year)
-                
-                year_diff = {
-                    'year': current_year,
-                    'previous_year': previous_year,
-                    'chapter_difference': total_chapters_diff,
-                    'rule_difference': total_rules_diff,
-                    'total_laws': total_laws
-                }
-                
-                differences.append(year_diff)
-                
-            except FileNotFoundError as e:
-                print(f"Warning: Could not find data file for year {year} or {previous_year}")
+
+            if current_year not in data_by_year or previous_year not in data_by_year:
+                logger.warning("Could not find data file for year %s or %s", year, previous_year)
                 continue
+
+            # The totals come from the cached per-year count tables, so the
+            # nested trees are walked once per file version rather than per
+            # request.
+            current_counts = _agency_counts_for(data_dir / f"nested_{current_year}.json")
+            previous_counts = _agency_counts_for(data_dir / f"nested_{previous_year}.json")
+            total_chapters_diff = DifferencesService._calculate_total_chapters_difference(
+                previous_counts,
+                current_counts
+            )
+            total_rules_diff = DifferencesService._calculate_total_rules_difference(
+                previous_counts,
+                current_counts
+            )
+
+            # Get total laws for current year
+            total_laws = DifferencesService._get_law_count_for_year(current_year)
+
+            year_diff = {
+                'year': current_year,
+                'previous_year': previous_year,
+                'chapter_difference': total_chapters_diff,
+                'rule_difference': total_rules_diff,
+                'total_laws': total_laws
+            }
+
+            differences.append(year_diff)
                 
         DifferencesService._set_differences_cache(start_year, end_year, differences)
         return differences
 
+    @staticmethod
+    def _index_year_entities(data: dict) -> Tuple[Dict, Dict]:
+        """
+        Walk one year's nested tree once, indexing chapters by
+        (agency_id, chapter_id) and rules by (agency_id, chapter_id,
+        rule_number). Tuple keys hash natively, avoiding a concatenated
+        string allocation per entity.
+        """
+        chapters = {}
+        rules = {}
+        for agency in data['agencies']:
+            agency_id = agency['agencyId']
+            agency_name = agency['agencyName']
+            for chapter in agency.get('chapters', []):
+                chapter_id = chapter['chapterId']
+                chapter_title = chapter['chapterTitle']
+                chapters[(agency_id, chapter_id)] = {
+                    'agency_id': agency_id,
+                    'agency_name': agency_name,
+                    'chapter_id': chapter_id,
+                    'chapter_title': chapter_title
+                }
+                for rule in chapter.get('rules', []):
+                    rules[(agency_id, chapter_id, rule['ruleNumber'])] = {
+                        'agency_id': agency_id,
+                        'agency_name': agency_name,
+                        'chapter_id': chapter_id,
+                        'chapter_title': chapter_title,
+                        'rule_number': rule['ruleNumber'],
+                        'rule_title': rule['ruleTitle']
+                    }
+        return chapters, rules
+
     @staticmethod
     @timed_cache(expire=3600)
     async def get_detailed_changes_between_years(year1: int, year2: int) -> dict:
@@ -240,115 +389,47 @@ class DifferencesService:
         year2_file = data_dir / f"nested_{year2}.json"
         
         try:
-            with open(year1_file, 'r') as f:
-                year1_data = json.load(f)
-            with open(year2_file, 'r') as f:
-                year2_data = json.load(f)
-                
-            changes = {
+            # The two yearly files are independent, so load them concurrently.
+            year1_data, year2_data = await asyncio.gather(
+                asyncio.to_thread(DifferencesService._read_json, year1_file),
+                asyncio.to_thread(DifferencesService._read_json, year2_file)
+            )
+
+            # Create lookup dictionaries for agencies
+            year1_agencies = {agency['agencyId']: agency for agency in year1_data['agencies']}
+            year2_agencies = {agency['agencyId']: agency for agency in year2_data['agencies']}
+
+            # Build chapter and rule lookups for both years in one pass each
+            year1_chapters, year1_rules = DifferencesService._index_year_entities(year1_data)
+            year2_chapters, year2_rules = DifferencesService._index_year_entities(year2_data)
+
+            # Dict key views subtract directly — no temporary set copies —
+            # and the comprehensions build each added/removed list in C.
+            return {
                 'year1': year1,
                 'year2': year2,
                 'agencies': {
-                    'added': [],
-                    'removed': []
+                    'added': [
+                        {'agency_id': agency_id, 'agency_name': year2_agencies[agency_id]['agencyName']}
+                        for agency_id in year2_agencies.keys() - year1_agencies.keys()
+                    ],
+                    'removed': [
+                        {'agency_id': agency_id, 'agency_name': year1_agencies[agency_id]['agencyName']}
+                        for agency_id in year1_agencies.keys() - year2_agencies.keys()
+                    ]
                 },
                 'chapters': {
-                    'added': [],
-                    'removed': []
+                    'added': [year2_chapters[key] for key in year2_chapters.keys() - year1_chapters.keys()],
+                    'removed': [year1_chapters[key] for key in year1_chapters.keys() - year2_chapters.keys()]
                 },
                 'rules': {
-                    'added': [],
-                    'removed': []
+                    'added': [year2_rules[key] for key in year2_rules.keys() - year1_rules.keys()],
+                    'removed': [year1_rules[key] for key in year1_rules.keys() - year2_rules.keys()]
                 }
             }
             
-            # Create lookup dictionaries for agencies
-            year1_agencies = {agency['agencyId']: agency for agency in year1_data['agencies']}
-            year2_agencies = {agency['agencyId']: agency for agency in year2_data['agencies']}
-            
-            # Find added and removed agencies
-            for agency_id in set(year2_agencies.keys()) - set(year1_agencies.keys()):
-                agency = year2_agencies[agency_id]
-                changes['agencies']['added'].append({
-                    'agency_id': agency['agencyId'],
-                    'agency_name': agency['agencyName']
-                })
-                
-            for agency_id in set(year1_agencies.keys()) - set(year2_agencies.keys()):
-                agency = year1_agencies[agency_id]
-                changes['agencies']['removed'].append({
-                    'agency_id': agency['agencyId'],
-                    'agency_name': agency['agencyName']
-                })
-            
-            # Track chapters and rules across all agencies
-            year1_chapters = {}
-            year2_chapters = {}
-            year1_rules = {}
-            year2_rules = {}
-            
-            # Build chapter and rule lookups for year1
-            for agency in year1_data['agencies']:
-                for chapter in agency.get('chapters', []):
-                    chapter_key = f"{agency['agencyId']}_{chapter['chapterId']}"
-                    year1_chapters[chapter_key] = {
-                        'agency_id': agency['agencyId'],
-                        'agency_name': agency['agencyName'],
-                        'chapter_id': chapter['chapterId'],
-                        'chapter_title': chapter['chapterTitle']
-                    }
-                    
-                    for rule in chapter.get('rules', []):
-                        rule_key = f"{chapter_key}_{rule['ruleNumber']}"
-                        year1_rules[rule_key] = {
-                            'agency_id': agency['agencyId'],
-                            'agency_name': agency['agencyName'],
-                            'chapter_id': chapter['chapterId'],
-                            'chapter_title': chapter['chapterTitle'],
-                            'rule_number': rule['ruleNumber'],
-                            'rule_title': rule['ruleTitle']
-                        }
-            
-            # Build chapter and rule lookups for year2
-            for agency in year2_data['agencies']:
-                for chapter in agency.get('chapters', []):
-                    chapter_key = f"{agency['agencyId']}_{chapter['chapterId']}"
-                    year2_chapters[chapter_key] = {
-                        'agency_id': agency['agencyId'],
-                        'agency_name': agency['agencyName'],
-                        'chapter_id': chapter['chapterId'],
-                        'chapter_title': chapter['chapterTitle']
-                    }
-                    
-                    for rule in chapter.get('rules', []):
-                        rule_key = f"{chapter_key}_{rule['ruleNumber']}"
-                        year2_rules[rule_key] = {
-                            'agency_id': agency['agencyId'],
-                            'agency_name': agency['agencyName'],
-                            'chapter_id': chapter['chapterId'],
-                            'chapter_title': chapter['chapterTitle'],
-                            'rule_number': rule['ruleNumber'],
-                            'rule_title': rule['ruleTitle']
-                        }
-            
-            # Find added and removed chapters
-            for chapter_key in set(year2_chapters.keys()) - set(year1_chapters.keys()):
-                changes['chapters']['added'].append(year2_chapters[chapter_key])
-            
-            for chapter_key in set(year1_chapters.keys()) - set(year2_chapters.keys()):
-                changes['chapters']['removed'].append(year1_chapters[chapter_key])
-            
-            # Find added and removed rules
-            for rule_key in set(year2_rules.keys()) - set(year1_rules.keys()):
-                changes['rules']['added'].append(year2_rules[rule_key])
-            
-            for rule_key in set(year1_rules.keys()) - set(year2_rules.keys()):
-                changes['rules']['removed'].append(year1_rules[rule_key])
-            
-            return changes
-            
         except FileNotFoundError as e:
-            print(f"Warning: Could not find data file for year {year1} or {year2}")
+            logger.warning("Could not find data file for year %s or %s", year1, year2)
             raise e 
 
     @staticmethod
@@ -360,17 +441,16 @@ class DifferencesService:
             year (int): The year to get law count for
             
         Returns:
-            int: Total number of laws for the year
+            int: Total number of laws for the year (0 if no file exists)
         """
-        try:
-            with open(f"src/data/laws/signed_bills_{year}.json", 'r') as f:
-                data = json.load(f)
-                return data.get('totalBills', 0)
-        except FileNotFoundError:
-            print(f"Warning: Could not find signed bills file for year {year}")
-            return 0 
+        count = _law_counts_table().get(year)
+        if count is None:
+            logger.warning("Could not find signed bills file for year %s", year)
+            return 0
+        return count
 
     @staticmethod
+    @timed_cache(expire=3600, cache_name="differences_cache")
     async def get_total_rules_by_year(start_year: int, end_year: int) -> List[dict]:
         """
         Get the total number of rules for each year in the dataset.
@@ -386,33 +466,23 @@ class DifferencesService:
         BASE_DIR = Path(__file__).resolve().parent.parent.parent
         data_dir = BASE_DIR / "src" / "data" / "rules"
         
+        # Overlap the independent file reads/parses before the sequential fold.
+        data_by_year = await DifferencesService._load_years_async(data_dir, start_year, end_year)
+
         for year in range(start_year, end_year + 1):
-            file_path = data_dir / f"nested_{year}.json"
-            
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    
-                total_rules = sum(
-                    chapter.get('ruleCount', 0)
-                    for agency in data['agencies']
-                    for chapter in agency.get('chapters', [])
-                )
-                
-                year_total = {
-                    'year': year,
-                    'total_rules': total_rules
-                }
-                
-                totals.append(year_total)
-                    
-            except FileNotFoundError as e:
-                print(f"Warning: Could not find data file for year {year}")
+            if year not in data_by_year:
+                logger.warning("Could not find data file for year %s", year)
                 continue
-                
-        return totals 
+
+            totals.append({
+                'year': year,
+                'total_rules': _year_summary(year).total_rules
+            })
+
+        return totals
 
     @staticmethod
+    @timed_cache(expire=3600, cache_name="differences_cache")
     async def get_new_rules_count_by_year(start_year: int, end_year: int) -> List[dict]:
         """
         Get the count of new rules and total laws for each year.
@@ -424,58 +494,36 @@ class DifferencesService:
         Returns:
             List[dict]: A list of new rule counts and total laws by year
         """
-        new_rule_counts = []
         BASE_DIR = Path(__file__).resolve().parent.parent.parent
         data_dir = BASE_DIR / "src" / "data" / "rules"
-        
-        for year in range(start_year + 1, end_year + 1):
-            current_year = year
-            previous_year = year - 1
-            
-            try:
-                # Load current and previous year data
-                with open(data_dir / f"nested_{current_year}.json", 'r') as f:
-                    current_data = json.load(f)
-                with open(data_dir / f"nested_{previous_year}.json", 'r') as f:
-                    previous_data = json.load(f)
-                
-                # Get all rule numbers from both years
-                current_rules = set()
-                previous_rules = set()
-                
-                # Collect rule numbers from current year
-                for agency in current_data['agencies']:
-                    for chapter in agency.get('chapters', []):
-                        for rule in chapter.get('rules', []):
-                            current_rules.add(rule['ruleNumber'])
-                
-                # Collect rule numbers from previous year
-                for agency in previous_data['agencies']:
-                    for chapter in agency.get('chapters', []):
-                        for rule in chapter.get('rules', []):
-                            previous_rules.add(rule['ruleNumber'])
-                
-                # Calculate new rules (rules in current year that weren't in previous year)
-                new_rules_count = len(current_rules - previous_rules)
-                
-                # Get total laws for current year using existing method
-                total_laws = DifferencesService._get_law_count_for_year(current_year)
-                
-                year_count = {
-                    'year': current_year,
-                    'new_rules_count': new_rules_count,
-                    'total_laws': total_laws
-                }
-                
-                new_rule_counts.append(year_count)
-                
-            except FileNotFoundError as e:
-                print(f"Warning: Could not find data file for year {year} or {previous_year}")
-                continue
-                
-        return new_rule_counts 
+
+        def _count_pair(previous_year: int, current_year: int) -> dict:
+            # Rule numbers per year come from cached frozensets, so the
+            # nested trees are only walked when a file version changes.
+            current_rules = _rule_numbers_for(data_dir / f"nested_{current_year}.json")
+            previous_rules = _rule_numbers_for(data_dir / f"nested_{previous_year}.json")
+            return {
+                'year': current_year,
+                'new_rules_count': len(current_rules - previous_rules),
+                'total_laws': DifferencesService._get_law_count_for_year(current_year)
+            }
+
+        # Each pair is independent, so the cold builds (file reads, tree
+        # walks, set differences) overlap in worker threads instead of
+        # running back to back on the event loop.
+        available = FileService.get_available_years_set(str(data_dir), "nested")
+        pairs = [
+            (year - 1, year)
+            for year in range(start_year + 1, end_year + 1)
+            if year in available and year - 1 in available
+        ]
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(_count_pair, previous_year, current_year)
+              for previous_year, current_year in pairs)
+        ))
 
     @staticmethod
+    @timed_cache(expire=3600, cache_name="differences_cache")
     async def get_agency_timeline(start_year: int, end_year: int) -> List[dict]:
         """
         Create a timeline of agency creations and removals between consecutive years.
@@ -487,59 +535,13 @@ class DifferencesService:
         Returns:
             List[dict]: Timeline of agency changes by year
         """
-        timeline = []
-        BASE_DIR = Path(__file__).resolve().parent.parent.parent
-        data_dir = BASE_DIR / "src" / "data" / "rules"
-        
-        for year in range(start_year + 1, end_year + 1):
-            current_year = year
-            previous_year = year - 1
-            
-            try:
-                # Load data from consecutive years
-                with open(data_dir / f"nested_{current_year}.json", 'r') as f:
-                    current_data = json.load(f)
-                with open(data_dir / f"nested_{previous_year}.json", 'r') as f:
-                    previous_data = json.load(f)
-                
-                # Create lookup dictionaries for agencies
-                current_agencies = {agency['agencyId']: agency for agency in current_data['agencies']}
-                previous_agencies = {agency['agencyId']: agency for agency in previous_data['agencies']}
-                
-                # Find new and removed agencies
-                new_agencies = []
-                removed_agencies = []
-                
-                for agency_id in set(current_agencies.keys()) - set(previous_agencies.keys()):
-                    agency = current_agencies[agency_id]
-                    new_agencies.append({
-                        'agency_id': agency['agencyId'],
-                        'agency_name': agency['agencyName']
-                    })
-                
-                for agency_id in set(previous_agencies.keys()) - set(current_agencies.keys()):
-                    agency = previous_agencies[agency_id]
-                    removed_agencies.append({
-                        'agency_id': agency['agencyId'],
-                        'agency_name': agency['agencyName']
-                    })
-                
-                # Only add years with changes to the timeline
-                if new_agencies or removed_agencies:
-                    year_changes = {
-                        'year': current_year,
-                        'created': new_agencies,
-                        'removed': removed_agencies
-                    }
-                    timeline.append(year_changes)
-                    
-            except FileNotFoundError:
-                print(f"Warning: Could not find data file for year {current_year} or {previous_year}")
-                continue
-        
-        return timeline
+        # Overlap the independent file reads/parses, then run the shared
+        # pairwise scan off the event loop against the warm memo.
+        await DifferencesService._load_years_async(_RULES_DIR, start_year, end_year)
+        return await asyncio.to_thread(_compute_agency_timeline, start_year, end_year)
 
     @staticmethod
+    @timed_cache(expire=3600, cache_name="differences_cache")
     async def get_total_rule_volume_by_year(start_year: int, end_year: int) -> List[dict]:
         """
         Calculate the total rule volume for each year which includes the total rule count
@@ -553,106 +555,80 @@ class DifferencesService:
             List[dict]: A list of dictionaries containing year, total_rules, and total_word_count.
         """
         volumes = []
-        BASE_DIR = Path(__file__).resolve().parent.parent.parent
-        rules_dir = BASE_DIR / "src" / "data" / "rules"
-        word_counts_dir = BASE_DIR / "src" / "data" / "rules" / "word_counts"
-        
-        for year in range(start_year, end_year + 1):
-            # Get total rule count from the rules file.
-            rules_file = rules_dir / f"nested_{year}.json"
-            try:
-                with open(rules_file, "r") as f:
-                    data = json.load(f)
-            except FileNotFoundError:
-                print(f"Warning: Could not find rules file for year {year}")
-                continue
-            
-            total_rules = sum(
-                len(chapter.get("rules", []))
-                for agency in data.get("agencies", [])
-                for chapter in agency.get("chapters", [])
-            )
-            
-            # Get total word count from the word_counts file.
-            word_count_file = word_counts_dir / f"grouped_word_count_{year}.json"
-            try:
-                with open(word_count_file, "r") as f:
-                    wc_data = json.load(f)
-                total_word_count = wc_data.get("total_word_count", 0)
-            except FileNotFoundError:
-                print(f"Warning: Could not find word count file for year {year}")
-                total_word_count = 0
-            
+
+        # Each year composes from the cached summary; the off-thread call
+        # keeps cold builds (file reads + walks) off the event loop. Years
+        # without a nested file are skipped by membership test up front.
+        available = FileService.get_available_years_set(str(_RULES_DIR), "nested")
+        years = [year for year in range(start_year, end_year + 1) if year in available]
+        summaries = await asyncio.gather(
+            *(asyncio.to_thread(_year_summary, year) for year in years)
+        )
+
+        for year, summary in zip(years, summaries):
             volumes.append({
                 "year": year,
-                "total_rules": total_rules,
-                "total_word_count": total_word_count
+                "total_rules": summary.total_listed_rules,
+                "total_word_count": summary.total_word_count
             })
-        
+
         return volumes
 
+def _compute_agency_timeline(start_year: int, end_year: int) -> List[dict]:
+    """
+    Single implementation of the agency creation/removal scan, shared by the
+    async endpoint and the standalone scraper so optimizations apply to both.
+    Reads go through the mtime-keyed memo, missing years are skipped by
+    membership test, and added/removed agencies come from dict key-view
+    differences.
+    """
+    timeline = []
+    available = FileService.get_available_years_set(str(_RULES_DIR), "nested")
+
+    for current_year in range(start_year + 1, end_year + 1):
+        previous_year = current_year - 1
+        if current_year not in available or previous_year not in available:
+            logger.warning("Could not find data file for year %s or %s", current_year, previous_year)
+            continue
+
+        current_data = DifferencesService._read_json(_RULES_DIR / f"nested_{current_year}.json")
+        previous_data = DifferencesService._read_json(_RULES_DIR / f"nested_{previous_year}.json")
+
+        # Create lookup dictionaries for agencies
+        current_agencies = {agency['agencyId']: agency for agency in current_data['agencies']}
+        previous_agencies = {agency['agencyId']: agency for agency in previous_data['agencies']}
+
+        new_agencies = [
+            {'agency_id': agency_id, 'agency_name': current_agencies[agency_id]['agencyName']}
+            for agency_id in current_agencies.keys() - previous_agencies.keys()
+        ]
+        removed_agencies = [
+            {'agency_id': agency_id, 'agency_name': previous_agencies[agency_id]['agencyName']}
+            for agency_id in previous_agencies.keys() - current_agencies.keys()
+        ]
+
+        # Only add years with changes to the timeline
+        if new_agencies or removed_agencies:
+            timeline.append({
+                'year': current_year,
+                'created': new_agencies,
+                'removed': removed_agencies
+            })
+
+    return timeline
+
 def scrape_agency_timeline(start_year: int, end_year: int) -> List[dict]:
     """
     Create a timeline of agency creations and removals between years.
-    
+
     Args:
         start_year (int): Starting year for analysis
         end_year (int): Ending year for analysis
-        
+
     Returns:
         List[dict]: Timeline of agency changes by year
     """
-    timeline = []
-    BASE_DIR = Path(__file__).resolve().parent.parent.parent
-    data_dir = BASE_DIR / "src" / "data" / "rules"
-    
-    for year in range(start_year + 1, end_year + 1):
-        current_year = year
-        previous_year = year - 1
-        
-        try:
-            # Load data from consecutive years
-            with open(data_dir / f"nested_{current_year}.json", 'r') as f:
-                current_data = json.load(f)
-            with open(data_dir / f"nested_{previous_year}.json", 'r') as f:
-                previous_data = json.load(f)
-            
-            # Create lookup dictionaries for agencies
-            current_agencies = {agency['agencyId']: agency for agency in current_data['agencies']}
-            previous_agencies = {agency['agencyId']: agency for agency in previous_data['agencies']}
-            
-            # Find new and removed agencies
-            new_agencies = []
-            removed_agencies = []
-            
-            for agency_id in set(current_agencies.keys()) - set(previous_agencies.keys()):
-                agency = current_agencies[agency_id]
-                new_agencies.append({
-                    'agency_id': agency['agencyId'],
-                    'agency_name': agency['agencyName']
-                })
-            
-            for agency_id in set(previous_agencies.keys()) - set(current_agencies.keys()):
-                agency = previous_agencies[agency_id]
-                removed_agencies.append({
-                    'agency_id': agency['agencyId'],
-                    'agency_name': agency['agencyName']
-                })
-            
-            # Only add years with changes to the timeline
-            if new_agencies or removed_agencies:
-                year_changes = {
-                    'year': current_year,
-                    'created': new_agencies,
-                    'removed': removed_agencies
-                }
-                timeline.append(year_changes)
-                
-        except FileNotFoundError:
-            print(f"Warning: Could not find data file for year {current_year} or {previous_year}")
-            continue
-    
-    return timeline
+    return _compute_agency_timeline(start_year, end_year)
 
 if __name__ == "__main__":
     # Example usage
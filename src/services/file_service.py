@@ -1,31 +1,23 @@
 from functools import lru_cache
-import json
-from pathlib import Path
-from typing import List, Dict
-from datetime import datetime
+import orjson
+import os
+from typing import List
 
 class FileService:
-    _file_cache: Dict[str, dict] = {}
-    _cache_timestamps: Dict[str, datetime] = {}
-    _CACHE_DURATION = 3600  # 1 hour in seconds
-
     @staticmethod
-    def read_json_file(file_path: str) -> dict:
+    def read_json_file(file_path) -> dict:
         """
-        Read and cache JSON file contents with timestamp-based expiration
+        Read and cache JSON file contents, keyed by path and mtime so a
+        changed file is re-read immediately while an unchanged one is
+        served from memory indefinitely (no TTL needed).
         """
-        current_time = datetime.now()
-        
-        # Check if cached and not expired
-        if (file_path in FileService._file_cache and 
-            (current_time - FileService._cache_timestamps[file_path]).total_seconds() < FileService._CACHE_DURATION):
-            return FileService._file_cache[file_path]
-        
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            FileService._file_cache[file_path] = data
-            FileService._cache_timestamps[file_path] = current_time
-            return data
+        return FileService._read_cached(str(file_path), os.stat(file_path).st_mtime_ns)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _read_cached(path: str, mtime_ns: int) -> dict:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
 
     @staticmethod
     @lru_cache(maxsize=32)
@@ -33,13 +25,27 @@ class FileService:
         """
         Get and cache available years from file names
         """
-        pattern = f"{file_prefix}_*.json"
-        files = Path(base_path).glob(pattern)
+        # One scandir with inline string checks: no Path object or fnmatch
+        # work per directory entry.
+        prefix = file_prefix + "_"
+        plen = len(prefix)
         years = []
-        for file in files:
-            try:
-                year = int(file.stem.replace(file_prefix + "_", ""))
-                years.append(year)
-            except ValueError:
-                continue
-        return sorted(years) 
\ No newline at end of file
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(".json"):
+                    try:
+                        years.append(int(name[plen:-5]))
+                    except ValueError:
+                        continue
+        years.sort()
+        return years
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get_available_years_set(base_path: str, file_prefix: str) -> frozenset:
+        """
+        Available years as a frozenset for membership tests, so callers can
+        skip missing years with a set lookup instead of open-and-catch.
+        """
+        return frozenset(FileService.get_available_years(base_path, file_prefix))
\ No newline at end of file
@@ -1,46 +1,87 @@
-import json
+import orjson
 import os
-from glob import glob
+from concurrent.futures import ProcessPoolExecutor
+
+_TARGET = "Engineering and Land Surveying Examining Board"
+_TARGET_BYTES = _TARGET.encode()
 
 def update_agency_ids(file_path):
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+
+    # A byte scan runs orders of magnitude faster than a JSON parse:
+    # files that never mention the board are skipped without parsing or
+    # rewriting anything.
+    if _TARGET_BYTES not in raw:
+        return
+
+    data = orjson.loads(raw)
+    changed = False
+    # Local aliases: LOAD_FAST slot access in the loops below instead of
+    # a module-dict lookup per iteration.
+    target = _TARGET
+    agencies = data.get("agencies", ())
+
     # Handle word_counts files
     if "agencies" in data:
-        for agency in data["agencies"]:
-            if "Engineering and Land Surveying Examining Board" in agency.get("agency", ""):
+        for agency in agencies:
+            # Fast path: look the name up once and skip non-matching
+            # agencies before touching their chapter lists.
+            name = agency.get("agency")
+            if not name or target not in name:
+                continue
+            if agency.get("agency_id") != "193.3":
                 agency["agency_id"] = "193.3"
-                # Update nested chapters
-                for chapter in agency.get("chapters", []):
-                    if "Engineering and Land Surveying Examining Board" in chapter.get("agency", ""):
-                        chapter["agency_id"] = "193.3"
-    
+                changed = True
+            # Update nested chapters
+            for chapter in agency.get("chapters", ()):
+                if target in chapter.get("agency", "") and chapter.get("agency_id") != "193.3":
+                    chapter["agency_id"] = "193.3"
+                    changed = True
+
     # Handle nested rules files
     else:
-        for agency in data.get("agencies", []):
-            if "Engineering and Land Surveying Examining Board" in agency.get("agencyName", ""):
+        for agency in agencies:
+            if target in agency.get("agencyName", "") and agency.get("agencyId") != "193.3":
                 agency["agencyId"] = "193.3"
-    
-    # Write the updated data back to the file
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=4)
+                changed = True
+
+    # Only rewrite files whose content actually moved
+    if not changed:
+        return
+
+    # Write to a sibling temp file and rename over the original: a crash
+    # mid-write can no longer leave a truncated JSON behind, which also
+    # makes the parallel run safe against torn files.
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, 'wb', buffering=1 << 20) as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, file_path)
+
+def _list_files(directory, prefix):
+    # One scandir pass with string checks: no fnmatch pattern matching
+    # per directory entry.
+    return [
+        entry.path
+        for entry in os.scandir(directory)
+        if entry.is_file() and entry.name.startswith(prefix) and entry.name.endswith(".json")
+    ]
 
 def main():
     # Update word_counts files
-    word_counts_path = "src/data/rules/word_counts"
-    word_count_files = glob(os.path.join(word_counts_path, "grouped_word_count_*.json"))
-    
+    word_count_files = _list_files("src/data/rules/word_counts", "grouped_word_count_")
+
     # Update nested rules files
-    rules_path = "src/data/rules"
-    rules_files = glob(os.path.join(rules_path, "nested_*.json"))
-    
+    rules_files = _list_files("src/data/rules", "nested_")
+
     all_files = word_count_files + rules_files
-    
-    for file_path in all_files:
-        print(f"Processing {file_path}...")
-        update_agency_ids(file_path)
-        print(f"Updated {file_path}")
+
+    # Each file is independent and the work is CPU-bound JSON
+    # parse/serialize, so worker processes scale it across cores.
+    print(f"Processing {len(all_files)} files...")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(update_agency_ids, all_files, chunksize=4))
+    print(f"Updated {len(all_files)} files")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file